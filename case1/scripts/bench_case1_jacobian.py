@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sse_case1_mgh17_solver_replay import (  # noqa: E402
+    JAC_MODES,
+    STARTS,
+    close_fd_pool,
+    compute_sse_JTJ_JTr,
+    gauss_newton,
+    model_and_jac,
+    fd_model_and_jac,
+    make_fd_pool,
+    read_mgh17_csv,
+)
+
+
+def max_jac_dev(data, b, mode):
+    ref = [model_and_jac(x, b)[1] for (x, _) in data]
+    got = [j for (_, j) in fd_model_and_jac(data, b, mode)]
+    dev = 0.0
+    for jr, jg in zip(ref, got):
+        for i in range(5):
+            dev = max(dev, abs(jg[i] - jr[i]) / max(1.0, abs(jr[i])))
+    return dev
+
+
+def time_per_iter(data, b, mode, repeats, pool=None):
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        compute_sse_JTJ_JTr(data, b, jac=mode, pool=pool)
+    return (time.perf_counter() - t0) / repeats
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--in_csv", required=True, help="Path to MGH17 CSV with headers x,y")
+    ap.add_argument("--start", type=int, default=2, choices=[1, 2, 3])
+    ap.add_argument("--repeats", type=int, default=200)
+    ap.add_argument("--jac_workers", type=int, default=1)
+    args = ap.parse_args()
+
+    data = read_mgh17_csv(args.in_csv)
+    b0 = STARTS[args.start]
+
+    # governance disabled except convergence, matching the allow_converged replay
+    gov = dict(
+        max_iter=50, damping=0.0, sse_on=True, a_min=0.0, s_max=1e9, step_norm_max=1e9,
+        cond_max=1e30, neg_imp_tol=-1e9, warmup_allow=12, conv_step_tol=1e-4, conv_imp_tol=1e-4,
+    )
+
+    pool = make_fd_pool(data, args.jac_workers) if args.jac_workers > 1 else None
+    try:
+        t_ref = None
+        print(f"{'jac':<10}{'us/iter':>12}{'x analytic':>12}{'iters':>8}{'status':>18}{'max |dJ|':>12}")
+        for mode in JAC_MODES:
+            p = pool if mode != "analytic" else None
+            t = time_per_iter(data, b0, mode, args.repeats, pool=p)
+            if t_ref is None:
+                t_ref = t
+            tr = gauss_newton(data=data, b0=b0, jac=mode, pool=p, **gov)
+            dev = 0.0 if mode == "analytic" else max_jac_dev(data, b0, mode)
+            print(f"{mode:<10}{t * 1e6:>12.1f}{t / t_ref:>12.2f}{len(tr):>8}{tr[-1]['status']:>18}{dev:>12.2e}")
+    finally:
+        if pool is not None:
+            close_fd_pool(pool)
+
+
+if __name__ == "__main__":
+    main()
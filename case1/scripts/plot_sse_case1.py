@@ -2,8 +2,11 @@ import argparse
 from pathlib import Path
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+DEFAULT_MAX_POINTS = 2000
+
 
 def _read_csv_if_exists(p: Path):
     if p.exists():
@@ -17,15 +20,67 @@ def _save(fig, out_path: Path):
     plt.close(fig)
 
 
-def _plot_series(df, xcol, ycol, title, out_png, ylog=False, hline=None, hline_label=None):
+def _must_keep_idx(y, hline=None, status=None, rows=None):
+    # rows on both sides of a threshold crossing or a status change are never dropped.
+    # status covers every trace row; rows maps each y position to its trace row (None = identity),
+    # so a change at a row missing from y keeps the nearest plotted neighbours.
+    keep = []
+    if hline is not None:
+        side = np.sign(y - hline)
+        i = np.flatnonzero((side[1:] != side[:-1]) & ~np.isnan(side[1:]) & ~np.isnan(side[:-1]))
+        keep.extend(i)
+        keep.extend(i + 1)
+    if status is not None:
+        if rows is None:
+            rows = np.arange(len(y))
+        i = np.flatnonzero(status[1:] != status[:-1])
+        before = np.searchsorted(rows, i, side="right") - 1
+        after = np.searchsorted(rows, i + 1, side="left")
+        keep.extend(before[before >= 0])
+        keep.extend(after[after < len(y)])
+    return keep
+
+
+def _downsample_idx(y, max_points, keep=()):
+    # min/max binning: each bin contributes its extremes, so peaks survive
+    n = len(y)
+    if not max_points or n <= max_points:
+        return np.arange(n)
+
+    edges = np.linspace(0, n, max(1, max_points // 2) + 1).astype(int)
+    idx = [0, n - 1]
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        if hi <= lo:
+            continue
+        seg = y[lo:hi]
+        if np.isnan(seg).all():
+            idx.append(lo)
+            continue
+        idx.append(lo + int(np.nanargmin(seg)))
+        idx.append(lo + int(np.nanargmax(seg)))
+    idx.extend(keep)
+    return np.unique(np.asarray(idx, dtype=int))
+
+
+def _plot_series(df, xcol, ycol, title, out_png, ylog=False, hline=None, hline_label=None,
+                 max_points=DEFAULT_MAX_POINTS):
     if xcol not in df.columns or ycol not in df.columns:
         return
 
     x = df[xcol].to_numpy()
-    y = df[ycol].to_numpy()
+    y = df[ycol].to_numpy(dtype=float)
+    status = df["status"].astype(str).to_numpy() if "status" in df.columns else None
+
+    n_rows = len(x)
+    idx = _downsample_idx(y, max_points, keep=_must_keep_idx(y, hline, status))
+    x = x[idx]
+    y = y[idx]
+    if len(x) < n_rows:
+        title = f"{title} [{len(x)} of {n_rows} points]"
 
     fig = plt.figure()
-    plt.plot(x, y, marker="o", label=None if len(x) > 1 else "single-iteration trace")
+    plt.plot(x, y, marker="o" if len(x) == n_rows else None,
+             label=None if len(x) > 1 else "single-iteration trace")
     plt.title(title)
     plt.xlabel(xcol)
     plt.ylabel(ycol)
@@ -77,7 +132,7 @@ def _plot_status_summary_single(df_sse: pd.DataFrame, out_png: Path, a_min=None,
     _save(fig, out_png)
 
 
-def plot_case1_folder(folder: Path, a_min=None, s_max=None):
+def plot_case1_folder(folder: Path, a_min=None, s_max=None, max_points=DEFAULT_MAX_POINTS):
     trace_sse_path = folder / "trace_sse.csv"
     df_sse = _read_csv_if_exists(trace_sse_path)
     if df_sse is None:
@@ -98,7 +153,8 @@ def plot_case1_folder(folder: Path, a_min=None, s_max=None):
         df_sse, "iter", "SSE",
         "SSE vs iter",
         plots_dir / "sse_vs_iter.png",
-        ylog=False
+        ylog=False,
+        max_points=max_points
     )
 
     _plot_series(
@@ -107,7 +163,8 @@ def plot_case1_folder(folder: Path, a_min=None, s_max=None):
         plots_dir / "a_vs_iter.png",
         ylog=False,
         hline=a_min,
-        hline_label="a_min" if a_min is not None else None
+        hline_label="a_min" if a_min is not None else None,
+        max_points=max_points
     )
 
     _plot_series(
@@ -116,14 +173,16 @@ def plot_case1_folder(folder: Path, a_min=None, s_max=None):
         plots_dir / "s_vs_iter.png",
         ylog=False,
         hline=s_max,
-        hline_label="s_max" if s_max is not None else None
+        hline_label="s_max" if s_max is not None else None,
+        max_points=max_points
     )
 
     _plot_series(
         df_sse, "iter", "cond",
         "cond vs iter (log scale)",
         plots_dir / "cond_vs_iter.png",
-        ylog=True
+        ylog=True,
+        max_points=max_points
     )
 
     if "step_norm" in df_sse.columns:
@@ -131,7 +190,8 @@ def plot_case1_folder(folder: Path, a_min=None, s_max=None):
             df_sse, "iter", "step_norm",
             "step_norm vs iter (log scale)",
             plots_dir / "step_norm_vs_iter.png",
-            ylog=True
+            ylog=True,
+            max_points=max_points
         )
 
 
@@ -140,6 +200,8 @@ def main():
     ap.add_argument("--case1_root", required=True, help="Path to 'Case 1' folder")
     ap.add_argument("--a_min", type=float, default=None)
     ap.add_argument("--s_max", type=float, default=None)
+    ap.add_argument("--max_points", type=int, default=DEFAULT_MAX_POINTS,
+                    help="Cap on plotted points per series (0 = plot every row)")
     ap.add_argument(
         "--folders",
         default="case1_abstain_singular,case1_deny_numeric,case1_allow_converged"
@@ -152,7 +214,7 @@ def main():
     for name in names:
         folder = root / name
         if folder.exists():
-            plot_case1_folder(folder, a_min=args.a_min, s_max=args.s_max)
+            plot_case1_folder(folder, a_min=args.a_min, s_max=args.s_max, max_points=args.max_points)
 
     print("Done. Plots saved under each scenario's 'plots' folder.")
 
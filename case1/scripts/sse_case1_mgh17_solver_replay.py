@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 import argparse
+import cmath
 import csv
+import hashlib
+import json
 import math
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 EPS = 1e-12
+MACH_EPS = sys.float_info.epsilon
+
+JAC_MODES = ("analytic", "forward", "central", "complex")
 
 STARTS = {
     1: [50.0, 150.0, -100.0, 1.0, 2.0],
@@ -20,6 +29,9 @@ def safe_exp(z: float) -> float:
         return math.exp(-700)
     return math.exp(z)
 
+def safe_cexp(z: complex) -> complex:
+    return cmath.exp(complex(max(-700.0, min(700.0, z.real)), z.imag))
+
 def read_mgh17_csv(path: str):
     data = []
     with open(path, "r", newline="", encoding="utf-8") as f:
@@ -48,6 +60,103 @@ def model_and_jac(x: float, b):
     ]
     return yhat, j
 
+def model_value(x: float, b, exp=safe_exp):
+    b1, b2, b3, b4, b5 = b
+    return b1 + b2 * exp(-b4 * x) + b3 * exp(-b5 * x)
+
+# ---------- Finite-difference Jacobian ----------
+def fd_steps(b, mode):
+    # relative steps: each parameter is perturbed in proportion to its own magnitude
+    if mode == "forward":
+        base = math.sqrt(MACH_EPS)
+    elif mode == "central":
+        base = MACH_EPS ** (1.0 / 3.0)
+    elif mode == "complex":
+        return [1e-20 * max(1.0, abs(v)) for v in b]
+    else:
+        raise ValueError("Unsupported finite-difference mode: " + str(mode))
+    steps = []
+    for v in b:
+        h = base * max(1.0, abs(v))
+        steps.append((v + h) - v)  # exactly representable step
+    return steps
+
+def fd_perturbations(b, mode, steps):
+    batch = []
+    for i, h in enumerate(steps):
+        if mode == "complex":
+            bp = [complex(v) for v in b]
+            bp[i] += complex(0.0, h)
+            batch.append(bp)
+            continue
+        bp = b[:]
+        bp[i] = b[i] + h
+        batch.append(bp)
+        if mode == "central":
+            bm = b[:]
+            bm[i] = b[i] - h
+            batch.append(bm)
+    return batch
+
+def _eval_batch(job):
+    # one pass over the data evaluates every perturbed parameter vector
+    xs, batch, use_complex = job
+    exp = safe_cexp if use_complex else safe_exp
+    return [[model_value(x, bp, exp) for x in xs] for bp in batch]
+
+# Worker processes receive the data once (pool initializer); each job then carries only
+# the perturbed parameter vectors and the row range it evaluates.
+_WORKER_XS = None
+
+def _init_fd_worker(xs):
+    global _WORKER_XS
+    _WORKER_XS = xs
+
+def _eval_rows(job):
+    lo, hi, batch, use_complex = job
+    return _eval_batch((_WORKER_XS[lo:hi], batch, use_complex))
+
+def make_fd_pool(data, workers):
+    xs = [x for (x, _) in data]
+    size = -(-len(xs) // workers)
+    return {
+        "executor": ProcessPoolExecutor(max_workers=workers, initializer=_init_fd_worker, initargs=(xs,)),
+        "rows": [(lo, min(lo + size, len(xs))) for lo in range(0, len(xs), size)],
+        "n": len(xs),
+    }
+
+def close_fd_pool(pool):
+    pool["executor"].shutdown()
+
+def fd_model_and_jac(data, b, mode, pool=None):
+    xs = [x for (x, _) in data]
+    steps = fd_steps(b, mode)
+    batch = fd_perturbations(b, mode, steps)
+    use_complex = mode == "complex"
+
+    if pool is None:
+        vals = _eval_batch((xs, batch, use_complex))
+    else:
+        if pool["n"] != len(xs):
+            raise ValueError("Finite-difference pool was initialised with different data")
+        jobs = [(lo, hi, batch, use_complex) for (lo, hi) in pool["rows"]]
+        vals = [[] for _ in batch]
+        for part in pool["executor"].map(_eval_rows, jobs):
+            for i, col in enumerate(part):
+                vals[i].extend(col)
+
+    base = [model_value(x, b) for x in xs]
+    rows = []
+    for n, yhat in enumerate(base):
+        if mode == "forward":
+            j = [(vals[i][n] - yhat) / steps[i] for i in range(5)]
+        elif mode == "central":
+            j = [(vals[2 * i][n] - vals[2 * i + 1][n]) / (2.0 * steps[i]) for i in range(5)]
+        else:
+            j = [vals[i][n].imag / steps[i] for i in range(5)]
+        rows.append((yhat, j))
+    return rows
+
 def mat_solve_5x5(A, b):
     n = 5
     M = [A[i][:] + [b[i]] for i in range(n)]
@@ -77,12 +186,28 @@ def cond_proxy(JTJ):
     mn = min(d for d in diags if d > 1e-30) if any(d > 1e-30 for d in diags) else 1e-30
     return max(1.0, mx / mn)
 
-def compute_sse_JTJ_JTr(data, bvec):
+def jac_model_evals(jac, n):
+    # model evaluations behind one compute_sse_JTJ_JTr call on n points
+    per_point = {"analytic": 1, "forward": 6, "central": 11, "complex": 6}
+    return per_point[jac] * n
+
+def compute_sse(data, bvec):
+    SSE = 0.0
+    for (x, y) in data:
+        r = y - model_value(x, bvec)
+        SSE += r * r
+    return SSE
+
+def compute_sse_JTJ_JTr(data, bvec, jac="analytic", pool=None):
+    if jac == "analytic":
+        rows = [model_and_jac(x, bvec) for (x, _) in data]
+    else:
+        rows = fd_model_and_jac(data, bvec, jac, pool)
+
     SSE = 0.0
     JTJ = [[0.0] * 5 for _ in range(5)]
     JTr = [0.0] * 5
-    for (x, y) in data:
-        yhat, j = model_and_jac(x, bvec)
+    for (x, y), (yhat, j) in zip(data, rows):
         r = y - yhat
         SSE += r * r
         for i in range(5):
@@ -120,17 +245,171 @@ def sse_resistance_update(s_old: float, improve_ratio: float, step_norm_n: float
 
     return max(0.0, s_old + max(0.0, delta) - decay)
 
+# ---------- Checkpoint / resume ----------
+CHECKPOINT_VERSION = 1
+
+def data_fingerprint(data):
+    return hashlib.sha256(repr(data).encode("utf-8")).hexdigest()
+
+def _atomic_write_text(path, text):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _trace_log_path(ckpt_path):
+    return ckpt_path + ".trace.jsonl"
+
+def save_checkpoint(ckpt_path, state, trace, logged):
+    # trace rows are appended to a sidecar log; the checkpoint only records how much of it is valid
+    log_path = _trace_log_path(ckpt_path)
+    with open(log_path, "ab") as f:
+        for row in trace[logged:]:
+            f.write((json.dumps(row) + "\n").encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+        state["trace_rows"] = len(trace)
+        state["trace_bytes"] = f.tell()
+    state["version"] = CHECKPOINT_VERSION
+    _atomic_write_text(ckpt_path, json.dumps(state))
+    return len(trace)
+
+def load_checkpoint(ckpt_path):
+    with open(ckpt_path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError("Unsupported checkpoint version: " + str(state.get("version")))
+
+    # rows logged after the last checkpoint belong to lost work and are dropped
+    log_path = _trace_log_path(ckpt_path)
+    with open(log_path, "r+b") as f:
+        if os.fstat(f.fileno()).st_size < state["trace_bytes"]:
+            raise ValueError("Checkpoint trace log is shorter than recorded: " + log_path)
+        f.truncate(state["trace_bytes"])
+        f.seek(0)
+        lines = f.read().decode("utf-8").splitlines()
+    trace = [json.loads(line) for line in lines]
+    if len(trace) != state["trace_rows"]:
+        raise ValueError("Checkpoint trace log is inconsistent: " + log_path)
+    return state, trace
+
+# ---------- Warm-start store ----------
+MODEL_NAME = "mgh17"
+WARM_STORE_VERSION = 1
+
+def data_summary(data):
+    xs = [x for (x, _) in data]
+    ys = [y for (_, y) in data]
+    n = len(ys)
+    y_mean = sum(ys) / n
+    y_std = math.sqrt(sum((y - y_mean) ** 2 for y in ys) / n)
+    return [float(n), min(xs), max(xs), y_mean, y_std]
+
+def _summary_distance(u, v):
+    return sum(abs(p - q) / max(1.0, abs(p), abs(q)) for p, q in zip(u, v))
+
+def load_warm_store(path):
+    if not os.path.exists(path):
+        return {"version": WARM_STORE_VERSION, "clock": 0, "entries": []}
+    with open(path, "r", encoding="utf-8") as f:
+        store = json.load(f)
+    if not isinstance(store, dict):
+        raise ValueError("Warm-start store must be a JSON object: " + path)
+    if store.get("version") != WARM_STORE_VERSION:
+        raise ValueError("Unsupported warm-start store version: " + str(store.get("version")))
+    if not isinstance(store.get("clock"), int) or not isinstance(store.get("entries"), list):
+        raise ValueError("Warm-start store is missing 'clock' or 'entries': " + path)
+    keys = ("model", "data", "summary", "b", "used")
+    if not all(isinstance(e, dict) and all(k in e for k in keys) for e in store["entries"]):
+        raise ValueError("Warm-start store has malformed entries: " + path)
+    return store
+
+def save_warm_store(path, store):
+    _atomic_write_text(path, json.dumps(store))
+
+def warm_lookup(store, model, fingerprint, summary, max_dist):
+    # exact dataset match first, otherwise the nearest summary within max_dist
+    best, best_d = None, None
+    for e in store["entries"]:
+        if e["model"] != model:
+            continue
+        d = 0.0 if e["data"] == fingerprint else _summary_distance(summary, e["summary"])
+        if d <= max_dist and (best is None or d < best_d):
+            best, best_d = e, d
+    if best is not None:
+        store["clock"] += 1
+        best["used"] = store["clock"]
+    return best, best_d
+
+def warm_record(store, model, fingerprint, summary, b, capacity):
+    store["clock"] += 1
+    entries = [e for e in store["entries"] if not (e["model"] == model and e["data"] == fingerprint)]
+    entries.append({"model": model, "data": fingerprint, "summary": summary, "b": list(b), "used": store["clock"]})
+    # LRU eviction: the logical clock keeps the store deterministic
+    while len(entries) > capacity:
+        entries.remove(min(entries, key=lambda e: e["used"]))
+    store["entries"] = entries
+
 def gauss_newton(data, b0, max_iter, damping, sse_on,
                 a_min, s_max, step_norm_max, cond_max, neg_imp_tol,
-                warmup_allow, conv_step_tol, conv_imp_tol):
+                warmup_allow, conv_step_tol, conv_imp_tol, jac="analytic", pool=None,
+                checkpoint_path=None, checkpoint_every=5, resume=False, metrics=None):
     b = b0[:]
     s = 0.0
     trace = []
-
-    for it in range(max_iter):
-        SSE_old, JTJ, JTr = compute_sse_JTJ_JTr(data, b)
+    start = 0
+    logged = 0
+
+    def record(row):
+        trace.append(row)
+        if metrics is not None:
+            metrics.lap("governance")
+            metrics.observe(row["status"], row["a"], row["s"])
+
+    config = None
+    if checkpoint_path is not None:
+        config = {
+            "data": data_fingerprint(data), "b0": list(b0), "max_iter": max_iter,
+            "damping": damping, "sse_on": sse_on, "a_min": a_min, "s_max": s_max,
+            "step_norm_max": step_norm_max, "cond_max": cond_max, "neg_imp_tol": neg_imp_tol,
+            "warmup_allow": warmup_allow, "conv_step_tol": conv_step_tol,
+            "conv_imp_tol": conv_imp_tol, "jac": jac,
+        }
+        if resume and os.path.exists(checkpoint_path):
+            state, trace = load_checkpoint(checkpoint_path)
+            if state["config"] != config:
+                raise ValueError("Checkpoint was written with a different configuration: " + checkpoint_path)
+            if state["done"]:
+                return trace
+            b, s, start, logged = state["b"], state["s"], state["next_iter"], len(trace)
+        else:
+            # a fresh run must not leave an older checkpoint behind for a later --resume
+            if os.path.exists(checkpoint_path):
+                os.remove(checkpoint_path)
+            open(_trace_log_path(checkpoint_path), "wb").close()
+
+    if metrics is not None:
+        metrics.begin()
+        n_jac_evals = jac_model_evals(jac, len(data))
+
+    for it in range(start, max_iter):
+        if config is not None and it > start and it % checkpoint_every == 0:
+            logged = save_checkpoint(checkpoint_path, {
+                "config": config, "next_iter": it, "b": b, "s": s, "done": False,
+            }, trace, logged)
+            if metrics is not None:
+                metrics.lap("checkpoint")
+
+        if metrics is not None:
+            metrics.lap()
+        SSE_old, JTJ, JTr = compute_sse_JTJ_JTr(data, b, jac=jac, pool=pool)
+        if metrics is not None:
+            metrics.lap("jacobian")
+            metrics.add_evals(n_jac_evals)
         if math.isnan(SSE_old) or math.isinf(SSE_old):
-            trace.append({
+            record({
                 "iter": it, "status": "NUMERIC_FAIL", "SSE": SSE_old,
                 "SSE_next": float("nan"), "improve_ratio": float("nan"),
                 "a": 0.0, "s": s, "step_norm": float("inf"), "cond": float("inf"),
@@ -144,10 +423,12 @@ def gauss_newton(data, b0, max_iter, damping, sse_on,
 
         cond = cond_proxy(JTJ)
         step = mat_solve_5x5(JTJ, JTr)
+        if metrics is not None:
+            metrics.lap("solve")
 
         if step is None:
             status = "SINGULAR_JTJ" if not sse_on else "ABSTAIN_SINGULAR"
-            trace.append({
+            record({
                 "iter": it, "status": status, "SSE": SSE_old,
                 "SSE_next": float("nan"), "improve_ratio": float("nan"),
                 "a": 0.0, "s": s, "step_norm": float("inf"), "cond": cond,
@@ -160,11 +441,14 @@ def gauss_newton(data, b0, max_iter, damping, sse_on,
         step_norm_n = step_norm / denom
 
         b_new = [b[i] + step[i] for i in range(5)]
-        SSE_new, _, _ = compute_sse_JTJ_JTr(data, b_new)
+        SSE_new = compute_sse(data, b_new)
+        if metrics is not None:
+            metrics.lap("trial")
+            metrics.add_evals(len(data))
         improve_ratio = (SSE_old - SSE_new) / max(SSE_old, EPS)
 
         if not sse_on:
-            trace.append({
+            record({
                 "iter": it, "status": "CLASSICAL_STEP", "SSE": SSE_old,
                 "SSE_next": SSE_new, "improve_ratio": improve_ratio,
                 "a": 1.0, "s": 0.0, "step_norm": step_norm_n, "cond": cond,
@@ -174,7 +458,7 @@ def gauss_newton(data, b0, max_iter, damping, sse_on,
             continue
 
         if step_norm_n < conv_step_tol and abs(improve_ratio) < conv_imp_tol:
-            trace.append({
+            record({
                 "iter": it, "status": "CONVERGED_ALLOW", "SSE": SSE_old,
                 "SSE_next": SSE_new, "improve_ratio": improve_ratio,
                 "a": 1.0, "s": s, "step_norm": step_norm_n, "cond": cond,
@@ -194,7 +478,7 @@ def gauss_newton(data, b0, max_iter, damping, sse_on,
                 deny = True
 
         status = "ALLOW" if not deny else "DENY"
-        trace.append({
+        record({
             "iter": it, "status": status, "SSE": SSE_old,
             "SSE_next": SSE_new, "improve_ratio": improve_ratio,
             "a": a, "s": s, "step_norm": step_norm_n, "cond": cond,
@@ -205,6 +489,16 @@ def gauss_newton(data, b0, max_iter, damping, sse_on,
             break
         b = b_new
 
+    if config is not None:
+        save_checkpoint(checkpoint_path, {
+            "config": config, "next_iter": max_iter, "b": b, "s": s, "done": True,
+        }, trace, logged)
+        if metrics is not None:
+            metrics.lap("checkpoint")
+
+    if metrics is not None:
+        metrics.finish()
+
     return trace
 
 def write_csv(path, rows, fieldnames):
@@ -218,9 +512,14 @@ def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--in_csv", required=True, help="Path to MGH17 CSV with headers x,y")
     ap.add_argument("--out_dir", default="out_case1_v3")
-    ap.add_argument("--start", type=int, default=1, choices=[1, 2, 3])
+    ap.add_argument("--start", default="1", choices=["1", "2", "3", "auto"],
+                    help="Fixed start vector, or 'auto' to warm-start from --warm_store")
     ap.add_argument("--max_iter", type=int, default=50)
     ap.add_argument("--damping", type=float, default=0.0)
+    ap.add_argument("--jac", default="analytic", choices=list(JAC_MODES),
+                    help="Jacobian backend: analytic, forward, central or complex (step)")
+    ap.add_argument("--jac_workers", type=int, default=1,
+                    help="Worker processes for finite-difference perturbations (1 = in-process batch)")
 
     ap.add_argument("--a_min", type=float, default=0.08)
     ap.add_argument("--s_max", type=float, default=10.0)
@@ -232,8 +531,39 @@ def main():
     ap.add_argument("--conv_step_tol", type=float, default=1e-6)
     ap.add_argument("--conv_imp_tol", type=float, default=1e-6)
 
+    ap.add_argument("--checkpoint_dir", default=None, help="Write solver checkpoints here (disabled if omitted)")
+    ap.add_argument("--checkpoint_every", type=int, default=5, help="Iterations between checkpoints")
+    ap.add_argument("--resume", action="store_true", help="Continue from checkpoints in --checkpoint_dir")
+
+    ap.add_argument("--warm_store", default=None, help="JSON store of converged b vectors (read by --start auto, "
+                                                       "updated on CONVERGED_ALLOW)")
+    ap.add_argument("--warm_capacity", type=int, default=256, help="Maximum store entries (LRU eviction)")
+    ap.add_argument("--warm_max_dist", type=float, default=0.05,
+                    help="Maximum relative summary distance for a warm-start match")
+    ap.add_argument("--warm_fallback", type=int, default=1, choices=[1, 2, 3],
+                    help="Fixed start used by --start auto when no stored solution matches")
+
+    ap.add_argument("--metrics_port", type=int, default=None,
+                    help="Serve live governance metrics (Prometheus text) on 127.0.0.1:PORT")
+    ap.add_argument("--metrics_file", default=None, help="Periodically flush governance metrics to this file")
+    ap.add_argument("--metrics_interval", type=float, default=1.0, help="Seconds between metrics file flushes")
+
     args = ap.parse_args()
     os.makedirs(args.out_dir, exist_ok=True)
+    if args.resume and args.checkpoint_dir is None:
+        ap.error("--resume requires --checkpoint_dir")
+    if args.checkpoint_every < 1:
+        ap.error("--checkpoint_every must be >= 1")
+    if args.start == "auto" and args.warm_store is None:
+        ap.error("--start auto requires --warm_store")
+    if args.warm_capacity < 1:
+        ap.error("--warm_capacity must be >= 1")
+
+    def ckpt(name):
+        if args.checkpoint_dir is None:
+            return None
+        os.makedirs(args.checkpoint_dir, exist_ok=True)
+        return os.path.join(args.checkpoint_dir, name + ".ckpt.json")
 
     try:
         data = read_mgh17_csv(args.in_csv)
@@ -241,20 +571,70 @@ def main():
         print("ERROR: failed to read input CSV:", e)
         sys.exit(2)
 
-    b0 = STARTS[args.start]
-
-    tr_classical = gauss_newton(
-        data=data, b0=b0, max_iter=args.max_iter, damping=args.damping, sse_on=False,
-        a_min=args.a_min, s_max=args.s_max, step_norm_max=args.step_norm_max,
-        cond_max=args.cond_max, neg_imp_tol=args.neg_imp_tol, warmup_allow=args.warmup_allow,
-        conv_step_tol=args.conv_step_tol, conv_imp_tol=args.conv_imp_tol
-    )
-    tr_sse = gauss_newton(
-        data=data, b0=b0, max_iter=args.max_iter, damping=args.damping, sse_on=True,
-        a_min=args.a_min, s_max=args.s_max, step_norm_max=args.step_norm_max,
-        cond_max=args.cond_max, neg_imp_tol=args.neg_imp_tol, warmup_allow=args.warmup_allow,
-        conv_step_tol=args.conv_step_tol, conv_imp_tol=args.conv_imp_tol
-    )
+    store = None
+    fingerprint = data_fingerprint(data)
+    summary = data_summary(data)
+    if args.warm_store is not None:
+        try:
+            store = load_warm_store(args.warm_store)
+        except (OSError, ValueError) as e:
+            print("ERROR: failed to read warm-start store:", e)
+            sys.exit(2)
+
+    start_note = args.start
+    if args.start == "auto":
+        hit, dist = warm_lookup(store, MODEL_NAME, fingerprint, summary, args.warm_max_dist)
+        if hit is not None:
+            b0 = hit["b"]
+            start_note = f"auto (warm-start, distance {dist:.3g})"
+        else:
+            b0 = STARTS[args.warm_fallback]
+            start_note = f"auto (no match, fallback {args.warm_fallback})"
+    else:
+        b0 = STARTS[int(args.start)]
+
+    m_classical = m_sse = exporter = None
+    if args.metrics_port is not None or args.metrics_file is not None:
+        sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+        from sse_metrics import GovernanceMetrics, MetricsExporter
+        m_classical = GovernanceMetrics("case1_mgh17", "classical")
+        m_sse = GovernanceMetrics("case1_mgh17", "sse")
+        try:
+            exporter = MetricsExporter([m_classical, m_sse], port=args.metrics_port,
+                                       path=args.metrics_file, interval=args.metrics_interval)
+        except OSError as e:
+            print("ERROR: failed to start metrics exporter:", e)
+            sys.exit(2)
+
+    pool = None
+    if args.jac != "analytic" and args.jac_workers > 1:
+        pool = make_fd_pool(data, args.jac_workers)
+
+    try:
+        tr_classical = gauss_newton(
+            data=data, b0=b0, max_iter=args.max_iter, damping=args.damping, sse_on=False,
+            a_min=args.a_min, s_max=args.s_max, step_norm_max=args.step_norm_max,
+            cond_max=args.cond_max, neg_imp_tol=args.neg_imp_tol, warmup_allow=args.warmup_allow,
+            conv_step_tol=args.conv_step_tol, conv_imp_tol=args.conv_imp_tol,
+            jac=args.jac, pool=pool, checkpoint_path=ckpt("classical"),
+            checkpoint_every=args.checkpoint_every, resume=args.resume, metrics=m_classical
+        )
+        tr_sse = gauss_newton(
+            data=data, b0=b0, max_iter=args.max_iter, damping=args.damping, sse_on=True,
+            a_min=args.a_min, s_max=args.s_max, step_norm_max=args.step_norm_max,
+            cond_max=args.cond_max, neg_imp_tol=args.neg_imp_tol, warmup_allow=args.warmup_allow,
+            conv_step_tol=args.conv_step_tol, conv_imp_tol=args.conv_imp_tol,
+            jac=args.jac, pool=pool, checkpoint_path=ckpt("sse"),
+            checkpoint_every=args.checkpoint_every, resume=args.resume, metrics=m_sse
+        )
+    except (OSError, ValueError) as e:
+        print("ERROR: solver run failed:", e)
+        sys.exit(2)
+    finally:
+        if pool is not None:
+            close_fd_pool(pool)
+        if exporter is not None:
+            exporter.close()
 
     fields = ["iter", "status", "SSE", "SSE_next", "improve_ratio", "a", "s", "step_norm", "cond",
               "b1", "b2", "b3", "b4", "b5"]
@@ -264,9 +644,17 @@ def main():
     def last_status(tr):
         return tr[-1]["status"] if tr else "NO_TRACE"
 
+    if store is not None:
+        if last_status(tr_sse) == "CONVERGED_ALLOW":
+            last = tr_sse[-1]
+            b_conv = [last["b1"], last["b2"], last["b3"], last["b4"], last["b5"]]
+            warm_record(store, MODEL_NAME, fingerprint, summary, b_conv, args.warm_capacity)
+        save_warm_store(args.warm_store, store)
+
     print("SSE Proof Series — Case 1 (MGH17) v3 complete.")
     print("Dataset points:", len(data))
-    print("Start:", args.start, "Initial b:", b0)
+    print("Start:", start_note, "Initial b:", b0)
+    print("Jacobian:", args.jac)
     print("Classical last status:", last_status(tr_classical), "iters:", len(tr_classical))
     print("SSE last status:", last_status(tr_sse), "iters:", len(tr_sse))
     print("Outputs written to:", args.out_dir)
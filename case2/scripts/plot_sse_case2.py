@@ -2,8 +2,11 @@ import argparse
 from pathlib import Path
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+DEFAULT_MAX_POINTS = 2000
+
 
 def read_csv(p: Path) -> pd.DataFrame:
     if not p.exists():
@@ -50,7 +53,50 @@ def is_single_or_terminal(df: pd.DataFrame):
     return False
 
 
-def plot_series(df: pd.DataFrame, xcol: str, ycol: str, title: str, out_png: Path, ylog: bool = False, hline=None, hline_label=None):
+def must_keep_idx(y, hline=None, status=None, rows=None):
+    # rows on both sides of a threshold crossing or a status change are never dropped.
+    # status covers every trace row; rows maps each y position to its trace row (None = identity),
+    # so a change at a row missing from y keeps the nearest plotted neighbours.
+    keep = []
+    if hline is not None:
+        side = np.sign(y - hline)
+        i = np.flatnonzero((side[1:] != side[:-1]) & ~np.isnan(side[1:]) & ~np.isnan(side[:-1]))
+        keep.extend(i)
+        keep.extend(i + 1)
+    if status is not None:
+        if rows is None:
+            rows = np.arange(len(y))
+        i = np.flatnonzero(status[1:] != status[:-1])
+        before = np.searchsorted(rows, i, side="right") - 1
+        after = np.searchsorted(rows, i + 1, side="left")
+        keep.extend(before[before >= 0])
+        keep.extend(after[after < len(y)])
+    return keep
+
+
+def downsample_idx(y, max_points, keep=()):
+    # min/max binning: each bin contributes its extremes, so peaks survive
+    n = len(y)
+    if not max_points or n <= max_points:
+        return np.arange(n)
+
+    edges = np.linspace(0, n, max(1, max_points // 2) + 1).astype(int)
+    idx = [0, n - 1]
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        if hi <= lo:
+            continue
+        seg = y[lo:hi]
+        if np.isnan(seg).all():
+            idx.append(lo)
+            continue
+        idx.append(lo + int(np.nanargmin(seg)))
+        idx.append(lo + int(np.nanargmax(seg)))
+    idx.extend(keep)
+    return np.unique(np.asarray(idx, dtype=int))
+
+
+def plot_series(df: pd.DataFrame, xcol: str, ycol: str, title: str, out_png: Path, ylog: bool = False, hline=None, hline_label=None,
+                max_points: int = DEFAULT_MAX_POINTS):
     if xcol not in df.columns or ycol not in df.columns:
         return False
 
@@ -62,11 +108,23 @@ def plot_series(df: pd.DataFrame, xcol: str, ycol: str, title: str, out_png: Pat
     if mask.sum() == 0:
         return False
 
+    # status changes are located on every trace row, including those dropped from y (e.g. ABSTAIN with a = NaN)
+    sc = choose_status_col(df)
+    status = df[sc].astype(str).str.upper().to_numpy() if sc is not None else None
+    rows = np.flatnonzero(mask.to_numpy())
+
     x = x[mask].to_numpy()
-    y = y[mask].to_numpy()
+    y = y[mask].to_numpy(dtype=float)
+
+    n_rows = len(x)
+    idx = downsample_idx(y, max_points, keep=must_keep_idx(y, hline, status, rows))
+    x = x[idx]
+    y = y[idx]
+    if len(x) < n_rows:
+        title = f"{title} [{len(x)} of {n_rows} points]"
 
     fig = plt.figure()
-    plt.plot(x, y, marker="o")
+    plt.plot(x, y, marker="o" if len(x) == n_rows else None)
     plt.title(title)
     plt.xlabel(xcol)
     plt.ylabel(ycol)
@@ -111,7 +169,7 @@ def plot_text_summary(df: pd.DataFrame, out_png: Path, title: str):
     save_plot(fig, out_png)
 
 
-def plot_case2_folder(folder: Path, a_min=None, s_max=None, r_safe=None):
+def plot_case2_folder(folder: Path, a_min=None, s_max=None, r_safe=None, max_points=DEFAULT_MAX_POINTS):
     trace = folder / "trace_sse.csv"
     df = read_csv(trace)
 
@@ -139,7 +197,8 @@ def plot_case2_folder(folder: Path, a_min=None, s_max=None, r_safe=None):
         if ycol in df.columns:
             title = f"{ycol} vs {xcol}"
             out = plots_dir / f"{ycol}_vs_{xcol}.png"
-            made_any |= plot_series(df, xcol, ycol, title, out, ylog=ylog, hline=hline, hline_label=hlabel)
+            made_any |= plot_series(df, xcol, ycol, title, out, ylog=ylog, hline=hline, hline_label=hlabel,
+                                    max_points=max_points)
 
     # If none of the preferred plots were possible, fall back to summary
     if not made_any:
@@ -156,6 +215,8 @@ def main():
     ap.add_argument("--a_min", type=float, default=None)
     ap.add_argument("--s_max", type=float, default=None)
     ap.add_argument("--r_safe", type=float, default=None)
+    ap.add_argument("--max_points", type=int, default=DEFAULT_MAX_POINTS,
+                    help="Cap on plotted points per series (0 = plot every row)")
     args = ap.parse_args()
 
     root = Path(args.case2_root).resolve()
@@ -172,7 +233,7 @@ def main():
     ok = 0
     for csv_path in csvs:
         folder = csv_path.parent
-        plot_case2_folder(folder, a_min=args.a_min, s_max=args.s_max, r_safe=args.r_safe)
+        plot_case2_folder(folder, a_min=args.a_min, s_max=args.s_max, r_safe=args.r_safe, max_points=args.max_points)
         plots_dir = folder / "plots"
         if not plots_dir.exists():
             raise RuntimeError(f"Expected plots folder missing: {plots_dir}")
@@ -1,9 +1,11 @@
 import os
+import sys
 import csv
 import math
 import argparse
 
 EPS = 1e-15
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 def _is_finite(x):
@@ -62,6 +64,10 @@ def fpp_recip(x):
     return 2.0 / (d ** 3)
 
 
+REGISTERED_FNS = ("sqrt", "recip")
+CORRIDORS = ("allow_safe", "deny_boundary", "abstain_instability")
+
+
 def choose_fn(name):
     name = (name or "").strip().lower()
     if name in ("sqrt", "root", "sqrtx"):
@@ -73,8 +79,12 @@ def choose_fn(name):
 
 # ---------- SSE overlay ----------
 def sse_permission_and_risk(fp, fpp, x, h):
-    G = abs(fp(x))
-    C = abs(fpp(x))
+    return _permission_and_risk(fp(x), fpp(x), h)
+
+
+def _permission_and_risk(fp_x, fpp_x, h):
+    G = abs(fp_x)
+    C = abs(fpp_x)
     if not _is_finite(G) or not _is_finite(C):
         return (float("nan"), float("nan"), float("nan"), float("nan"))
     r = (C * abs(h)) / (1.0 + G)
@@ -82,18 +92,29 @@ def sse_permission_and_risk(fp, fpp, x, h):
     return (G, C, r, a)
 
 
-def run_scenario(fn_tag, f, fp, fpp, xs, h, a_min, s_max, r_safe, out_dir):
-    classical_rows = []
+def evaluate_scenario(f, fp, fpp, xs, h, a_min, s_max, r_safe, base=None, metrics=None):
+    # base: optional precomputed (f(x), f'(x), f''(x)) per x, shared across step sizes
+    if metrics is not None:
+        metrics.lap()
+    if base is None:
+        base = [(f(x), fp(x), fpp(x)) for x in xs]
+        if metrics is not None:
+            metrics.lap("derivatives")
+            metrics.add_evals(3 * len(xs))
+
     sse_rows = []
     s = 0.0
 
-    for k, x in enumerate(xs):
+    for k, (x, (f_x, fp_x, fpp_x)) in enumerate(zip(xs, base)):
         y_true = f(x + h)
-        y_lin = f(x) + fp(x) * h
+        y_lin = f_x + fp_x * h
         err = abs(y_true - y_lin) if (_is_finite(y_true) and _is_finite(y_lin)) else float("nan")
 
         status = "ALLOW"
-        G, C, r, a = sse_permission_and_risk(fp, fpp, x, h)
+        G, C, r, a = _permission_and_risk(fp_x, fpp_x, h)
+        if metrics is not None:
+            metrics.lap("linearize")
+            metrics.add_evals(1)
 
         # ABSTAIN if calculus value is undefined or the structural terms are undefined
         if (not _is_finite(y_true)) or (not _is_finite(y_lin)) or (not _is_finite(a)):
@@ -108,8 +129,17 @@ def run_scenario(fn_tag, f, fp, fpp, xs, h, a_min, s_max, r_safe, out_dir):
             if (a < a_min) or (s > s_max):
                 status = "DENY"
 
-        classical_rows.append([k, x, h, y_true, y_lin, err])
         sse_rows.append([k, x, h, y_true, y_lin, err, a, s, status])
+        if metrics is not None:
+            metrics.lap("governance")
+            metrics.observe(status, a, s)
+
+    return sse_rows
+
+
+def run_scenario(fn_tag, f, fp, fpp, xs, h, a_min, s_max, r_safe, out_dir, metrics=None):
+    sse_rows = evaluate_scenario(f, fp, fpp, xs, h, a_min, s_max, r_safe, metrics=metrics)
+    classical_rows = [row[:6] for row in sse_rows]
 
     _safe_mkdir(out_dir)
     _write_csv(
@@ -146,29 +176,124 @@ def build_corridors(fn_tag):
     raise ValueError("Unsupported fn_tag")
 
 
+def run_batch(hs, a_min, s_max, r_safe, out_csv, metrics=None):
+    # every registered function x every corridor x every h, written as one combined table
+    rows = []
+    for fn_tag in REGISTERED_FNS:
+        _, f, fp, fpp = choose_fn(fn_tag)
+        for corridor, xs in zip(CORRIDORS, build_corridors(fn_tag)):
+            if metrics is not None:
+                metrics.lap()
+            base = [(f(x), fp(x), fpp(x)) for x in xs]
+            if metrics is not None:
+                metrics.lap("derivatives")
+                metrics.add_evals(3 * len(xs))
+            for h in hs:
+                for row in evaluate_scenario(f, fp, fpp, xs, h, a_min, s_max, r_safe, base=base, metrics=metrics):
+                    rows.append([fn_tag, corridor] + row)
+
+    parent = os.path.dirname(out_csv)
+    if parent:
+        _safe_mkdir(parent)
+    _write_csv(
+        out_csv,
+        ["fn", "corridor", "k", "x", "h", "y_true", "y_lin", "err_abs", "a", "s", "status"],
+        rows,
+    )
+    return rows
+
+
+def _parse_hs(text):
+    try:
+        hs = [float(v) for v in text.split(",") if v.strip()]
+    except ValueError:
+        raise ValueError(f"--hs must be comma-separated numbers, got: {text!r}")
+    if not hs:
+        raise ValueError("--hs must list at least one step size")
+    if not all(_is_finite(h) for h in hs):
+        raise ValueError(f"--hs step sizes must be finite, got: {text!r}")
+    return hs
+
+
 def main():
     ap = argparse.ArgumentParser()
-    ap.add_argument("--fn", default="sqrt", help="Function: sqrt or recip")
+    ap.add_argument("--fn", default=None, help="Function: sqrt or recip (default: sqrt)")
     ap.add_argument("--root", default=".", help="SSE root output directory")
     ap.add_argument("--a_min", type=float, default=0.70)
     ap.add_argument("--s_max", type=float, default=0.80)
     ap.add_argument("--r_safe", type=float, default=0.15)
-    ap.add_argument("--h", type=float, default=1e-3)
+    ap.add_argument("--h", type=float, default=None, help="Step size (default: 1e-3)")
+    ap.add_argument("--batch", action="store_true",
+                    help="Evaluate every function, corridor and --hs step size into one combined CSV")
+    ap.add_argument("--hs", default=None, help="Comma-separated step sizes for --batch (default: 1e-2,1e-3,1e-4)")
+    ap.add_argument("--out_csv", default=None, help="Combined batch output (default: <root>/case2_atlas.csv)")
+    ap.add_argument("--metrics_port", type=int, default=None,
+                    help="Serve live governance metrics (Prometheus text) on 127.0.0.1:PORT")
+    ap.add_argument("--metrics_file", default=None, help="Periodically flush governance metrics to this file")
+    ap.add_argument("--metrics_interval", type=float, default=1.0, help="Seconds between metrics file flushes")
     args = ap.parse_args()
 
-    fn_tag, f, fp, fpp = choose_fn(args.fn)
+    if args.batch:
+        if args.fn is not None or args.h is not None:
+            ap.error("--batch evaluates every function and --hs step size; do not combine it with --fn or --h")
+        try:
+            args.hs = _parse_hs(args.hs if args.hs is not None else "1e-2,1e-3,1e-4")
+        except ValueError as e:
+            ap.error(str(e))
+    else:
+        if args.hs is not None or args.out_csv is not None:
+            ap.error("--hs and --out_csv require --batch")
+        args.fn = args.fn if args.fn is not None else "sqrt"
+        args.h = args.h if args.h is not None else 1e-3
+        try:
+            choose_fn(args.fn)
+        except ValueError as e:
+            ap.error(str(e))
+
     root = os.path.abspath(args.root)
 
+    metrics = exporter = None
+    if args.metrics_port is not None or args.metrics_file is not None:
+        sys.path.insert(0, os.path.join(REPO_ROOT, "scripts"))
+        from sse_metrics import GovernanceMetrics, MetricsExporter
+        metrics = GovernanceMetrics("case2_corridor", "batch" if args.batch else choose_fn(args.fn)[0])
+        try:
+            exporter = MetricsExporter([metrics], port=args.metrics_port,
+                                       path=args.metrics_file, interval=args.metrics_interval)
+        except OSError as e:
+            ap.error(f"cannot start metrics exporter: {e}")
+
+    try:
+        _run_main(args, root, metrics)
+        if metrics is not None:
+            metrics.finish()
+    finally:
+        if exporter is not None:
+            exporter.close()
+
+
+def _run_main(args, root, metrics):
+    if args.batch:
+        hs = args.hs
+        out_csv = args.out_csv or os.path.join(root, "case2_atlas.csv")
+        rows = run_batch(hs, args.a_min, args.s_max, args.r_safe, out_csv, metrics=metrics)
+        print("SSE Case 2 batch generated:")
+        print(f" - {len(REGISTERED_FNS)} functions x {len(CORRIDORS)} corridors x {len(hs)} step sizes")
+        print(f" - {len(rows)} rows in {out_csv}")
+        return
+
+    fn_tag, f, fp, fpp = choose_fn(args.fn)
+
     xs_allow, xs_deny, xs_abstain = build_corridors(fn_tag)
 
     # IMPORTANT: include fn_tag in folder names to prevent overwrite between runs
-    out_allow = os.path.join(root, f"case2_{fn_tag}_allow_safe_corridor")
-    out_deny = os.path.join(root, f"case2_{fn_tag}_deny_boundary_corridor")
-    out_abstain = os.path.join(root, f"case2_{fn_tag}_abstain_instability_corridor")
+    out_allow = os.path.join(root, f"case2_{fn_tag}_{CORRIDORS[0]}_corridor")
+    out_deny = os.path.join(root, f"case2_{fn_tag}_{CORRIDORS[1]}_corridor")
+    out_abstain = os.path.join(root, f"case2_{fn_tag}_{CORRIDORS[2]}_corridor")
 
-    run_scenario(fn_tag, f, fp, fpp, xs_allow, args.h, args.a_min, args.s_max, args.r_safe, out_allow)
-    run_scenario(fn_tag, f, fp, fpp, xs_deny, args.h, args.a_min, args.s_max, args.r_safe, out_deny)
-    run_scenario(fn_tag, f, fp, fpp, xs_abstain, args.h, args.a_min, args.s_max, args.r_safe, out_abstain)
+    run_scenario(fn_tag, f, fp, fpp, xs_allow, args.h, args.a_min, args.s_max, args.r_safe, out_allow, metrics)
+    run_scenario(fn_tag, f, fp, fpp, xs_deny, args.h, args.a_min, args.s_max, args.r_safe, out_deny, metrics)
+    run_scenario(fn_tag, f, fp, fpp, xs_abstain, args.h, args.a_min, args.s_max, args.r_safe, out_abstain, metrics)
 
     print("SSE Case 2 generated:")
     print(f" - {os.path.basename(out_allow)}")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Each GovernanceMetrics object has a single writer (the engine loop). Readers only take
+# C-level snapshots (dict copies, attribute reads), so no locks sit on the hot path.
+
+
+class GovernanceMetrics:
+    def __init__(self, engine, run):
+        self.labels = {"engine": engine, "run": run}
+        self.started = time.perf_counter()
+        self.ended = None
+        self.iterations = 0
+        self.model_evals = 0
+        self.a = float("nan")
+        self.s = float("nan")
+        self.status_counts = {}
+        self.phase_seconds = {}
+        self.phase_calls = {}
+        self._t_last = self.started
+
+    def begin(self):
+        self.started = time.perf_counter()
+        self.ended = None
+        self._t_last = self.started
+
+    def finish(self):
+        # freezes the iteration rate once the engine loop has returned
+        self.ended = time.perf_counter()
+
+    def observe(self, status, a, s):
+        self.iterations += 1
+        self.a = a
+        self.s = s
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def add_evals(self, n):
+        self.model_evals += n
+
+    def lap(self, phase=None):
+        # time since the previous lap is charged to `phase`; lap() with no phase only resets
+        now = time.perf_counter()
+        if phase is not None:
+            self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + (now - self._t_last)
+            self.phase_calls[phase] = self.phase_calls.get(phase, 0) + 1
+        self._t_last = now
+
+
+def _escape_label(v):
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt_labels(labels):
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items()) + "}"
+
+
+def _fmt_value(v):
+    if isinstance(v, int):
+        return str(v)
+    if math.isnan(v):
+        return "NaN"
+    if math.isinf(v):
+        return "+Inf" if v > 0 else "-Inf"
+    return repr(float(v))
+
+
+METRIC_HELP = [
+    ("sse_iterations_total", "counter", "Governed iterations / evaluation steps recorded"),
+    ("sse_iterations_per_second", "gauge", "Average iteration rate over the run (frozen once it ends)"),
+    ("sse_model_evaluations_total", "counter", "Model / function evaluations"),
+    ("sse_permission_a", "gauge", "Current structural permission a"),
+    ("sse_resistance_s", "gauge", "Current structural resistance s"),
+    ("sse_status_total", "counter", "Trace rows per governance status"),
+    ("sse_phase_seconds_total", "counter", "Wall time spent per engine phase"),
+    ("sse_phase_calls_total", "counter", "Timed calls per engine phase"),
+]
+
+
+def render_prometheus(metrics_list):
+    now = time.perf_counter()
+    samples = {name: [] for name, _, _ in METRIC_HELP}
+    for m in metrics_list:
+        lab = m.labels
+        ended = m.ended
+        elapsed = max((ended if ended is not None else now) - m.started, 1e-12)
+        iterations = m.iterations
+        samples["sse_iterations_total"].append((lab, iterations))
+        samples["sse_iterations_per_second"].append((lab, iterations / elapsed))
+        samples["sse_model_evaluations_total"].append((lab, m.model_evals))
+        samples["sse_permission_a"].append((lab, m.a))
+        samples["sse_resistance_s"].append((lab, m.s))
+        for status, n in sorted(dict(m.status_counts).items()):
+            samples["sse_status_total"].append((dict(lab, status=status), n))
+        for phase, sec in sorted(dict(m.phase_seconds).items()):
+            samples["sse_phase_seconds_total"].append((dict(lab, phase=phase), sec))
+        for phase, n in sorted(dict(m.phase_calls).items()):
+            samples["sse_phase_calls_total"].append((dict(lab, phase=phase), n))
+
+    lines = []
+    for name, kind, help_text in METRIC_HELP:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, v in samples[name]:
+            lines.append(f"{name}{_fmt_labels(labels)} {_fmt_value(v)}")
+    return "\n".join(lines) + "\n"
+
+
+def _write_atomic(path, text):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+# Serves metrics on localhost (Prometheus text format) and/or flushes them to a file
+class MetricsExporter:
+    def __init__(self, metrics_list, port=None, path=None, interval=1.0, host="127.0.0.1"):
+        self.metrics_list = metrics_list
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._server = None
+        self._threads = []
+
+        if port is not None:
+            exporter = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path.split("?")[0] not in ("/metrics", "/"):
+                        self.send_error(404)
+                        return
+                    body = render_prometheus(exporter.metrics_list).encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, fmt, *args):
+                    pass
+
+            self._server = ThreadingHTTPServer((host, port), Handler)
+            self._threads.append(threading.Thread(target=self._server.serve_forever, daemon=True))
+
+        if path is not None:
+            self._threads.append(threading.Thread(target=self._flush_loop, daemon=True))
+
+        for t in self._threads:
+            t.start()
+
+    @property
+    def address(self):
+        return self._server.server_address if self._server is not None else None
+
+    def flush(self):
+        if self.path is not None:
+            _write_atomic(self.path, render_prometheus(self.metrics_list))
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def close(self):
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        for t in self._threads:
+            t.join()
+        self.flush()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+import argparse
+import csv
+import hashlib
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASE1_SCRIPT = os.path.join(REPO_ROOT, "case1", "scripts", "sse_case1_mgh17_solver_replay.py")
+CASE1_DATA = os.path.join(REPO_ROOT, "case1", "data", "mgh17_data.csv")
+CASE2_SCRIPT = os.path.join(REPO_ROOT, "case2", "scripts", "sse_case2_calculus_linearization.py")
+
+# Frozen reference runs (same arguments as docs/Quickstart.md)
+CASE1_RUNS = {
+    "abstain_singular": ["--start", "1"],
+    "deny_numeric": ["--start", "1", "--damping", "1e-3"],
+    "allow_converged": [
+        "--start", "2", "--warmup_allow", "12", "--neg_imp_tol=-1e9", "--step_norm_max", "1e9",
+        "--cond_max", "1e30", "--a_min", "0.0", "--s_max", "1e9",
+        "--conv_step_tol", "1e-4", "--conv_imp_tol", "1e-4",
+    ],
+}
+CASE2_FNS = ("sqrt", "recip")
+CASE2_CORRIDORS = ("allow_safe", "deny_boundary", "abstain_instability")
+TRACE_FILES = ("trace_classical.csv", "trace_sse.csv")
+# Reference runs shipped without frozen traces (the directory holds only a .gitkeep)
+UNREFERENCED_RUNS = (os.path.join("case2", "sqrt_abstain_instability_corridor"),)
+
+# Categorical / index columns are compared exactly, everything numeric within tolerance
+EXACT_COLS = {"status", "iter", "k", "fn", "corridor"}
+CACHE_VERSION = 1
+
+
+def _run(cmd):
+    p = subprocess.run(cmd, capture_output=True, text=True)
+    if p.returncode != 0:
+        raise RuntimeError(f"Command failed ({p.returncode}): {' '.join(cmd)}\n{p.stdout}{p.stderr}")
+
+
+def regenerate(out_root, workers):
+    raw2 = os.path.join(out_root, "_case2_raw")
+    cmds = []
+    for name, extra in CASE1_RUNS.items():
+        out_dir = os.path.join(out_root, "case1", name)
+        cmds.append([sys.executable, CASE1_SCRIPT, "--in_csv", CASE1_DATA, "--out_dir", out_dir] + extra)
+    for fn in CASE2_FNS:
+        cmds.append([sys.executable, CASE2_SCRIPT, "--fn", fn, "--root", raw2])
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(_run, cmds))
+
+    # mirror the repository layout: case2_<fn>_<corridor> -> case2/<fn>_<corridor>
+    os.makedirs(os.path.join(out_root, "case2"), exist_ok=True)
+    for name in sorted(os.listdir(raw2)):
+        dst = os.path.join(out_root, "case2", name[len("case2_"):] if name.startswith("case2_") else name)
+        if os.path.exists(dst):
+            shutil.rmtree(dst)
+        os.replace(os.path.join(raw2, name), dst)
+    shutil.rmtree(raw2)
+
+
+def reference_traces(root):
+    # the shipped reference runs only; scratch outputs elsewhere in the tree are ignored
+    dirs = [os.path.join("case1", name) for name in CASE1_RUNS]
+    dirs += [os.path.join("case2", f"{fn}_{c}_corridor") for fn in CASE2_FNS for c in CASE2_CORRIDORS]
+    return [os.path.join(d, t) for d in dirs if d not in UNREFERENCED_RUNS for t in TRACE_FILES]
+
+
+def find_traces(root):
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for fname in sorted(filenames):
+            if fname.startswith("trace_") and fname.endswith(".csv"):
+                found.append(os.path.relpath(os.path.join(dirpath, fname), root))
+    return found
+
+
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _to_float(v):
+    try:
+        return float(v)
+    except ValueError:
+        return None
+
+
+def _cell_equal(col, ref, new, rtol, atol):
+    if col in EXACT_COLS or ref == new:
+        return ref == new
+    a, b = _to_float(ref), _to_float(new)
+    if a is None or b is None:
+        return False
+    if math.isnan(a) or math.isnan(b):
+        return math.isnan(a) and math.isnan(b)
+    if math.isinf(a) or math.isinf(b):
+        return a == b
+    return abs(a - b) <= atol + rtol * max(abs(a), abs(b))
+
+
+def compare_traces(ref_path, new_path, rtol, atol):
+    with open(ref_path, "r", newline="", encoding="utf-8") as f:
+        ref_rows = list(csv.reader(f))
+    with open(new_path, "r", newline="", encoding="utf-8") as f:
+        new_rows = list(csv.reader(f))
+
+    if not ref_rows or not new_rows or ref_rows[0] != new_rows[0]:
+        return {"row": None, "column": "<header>",
+                "ref": ",".join(ref_rows[0]) if ref_rows else "",
+                "new": ",".join(new_rows[0]) if new_rows else ""}
+
+    header = ref_rows[0]
+    for i, (rr, nr) in enumerate(zip(ref_rows[1:], new_rows[1:])):
+        if len(rr) != len(nr):
+            return {"row": i, "column": "<width>", "ref": len(rr), "new": len(nr)}
+        for col, rv, nv in zip(header, rr, nr):
+            if not _cell_equal(col, rv, nv, rtol, atol):
+                return {"row": i, "column": col, "ref": rv, "new": nv}
+
+    if len(ref_rows) != len(new_rows):
+        i = min(len(ref_rows), len(new_rows)) - 1
+        return {"row": i, "column": "<length>", "ref": len(ref_rows) - 1, "new": len(new_rows) - 1}
+    return None
+
+
+def verify_pair(job):
+    rel, ref_path, new_path, rtol, atol, cached = job
+    if not os.path.exists(ref_path):
+        return {"rel": rel, "ok": False, "how": "missing_reference", "diff": None}
+    if not os.path.exists(new_path):
+        return {"rel": rel, "ok": False, "how": "missing", "diff": None}
+
+    h_ref, h_new = _sha256(ref_path), _sha256(new_path)
+    if cached is not None and cached["ref"] == h_ref and cached["new"] == h_new:
+        return dict(cached, rel=rel, how="cached")
+
+    if h_ref == h_new:
+        diff = None
+        how = "identical"
+    else:
+        diff = compare_traces(ref_path, new_path, rtol, atol)
+        how = "compared"
+    return {"rel": rel, "ok": diff is None, "how": how, "diff": diff, "ref": h_ref, "new": h_new}
+
+
+def load_cache(path, rtol, atol):
+    if path is None or not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        cache = json.load(f)
+    # results are only reusable under the same tolerances
+    if cache.get("version") != CACHE_VERSION or cache.get("rtol") != rtol or cache.get("atol") != atol:
+        return {}
+    return cache.get("pairs", {})
+
+
+def save_cache(path, results, rtol, atol):
+    pairs = {}
+    for r in results:
+        if "ref" in r:
+            pairs[r["rel"]] = {"ref": r["ref"], "new": r["new"], "ok": r["ok"], "diff": r["diff"]}
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": CACHE_VERSION, "rtol": rtol, "atol": atol, "pairs": pairs}, f)
+    os.replace(tmp, path)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--ref_root", default=None,
+                    help="Root holding reference traces, walked for every trace_*.csv "
+                         "(default: the shipped references in this repository)")
+    ap.add_argument("--new_root", default=None,
+                    help="Root holding traces to verify (default: regenerate the shipped references)")
+    ap.add_argument("--regen_dir", default=None, help="Keep regenerated traces here instead of a temp dir")
+    ap.add_argument("--rtol", type=float, default=1e-7)
+    ap.add_argument("--atol", type=float, default=1e-10)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--cache", default=None,
+                    help="Content-hash cache (default: <new_root>/.sse_verify_cache.json when --new_root is given)")
+    args = ap.parse_args()
+
+    tmp_dir = None
+    new_root = args.new_root
+    cache_path = args.cache
+    if new_root is None:
+        new_root = args.regen_dir or tempfile.mkdtemp(prefix="sse_verify_")
+        tmp_dir = None if args.regen_dir else new_root
+    elif cache_path is None:
+        cache_path = os.path.join(new_root, ".sse_verify_cache.json")
+
+    try:
+        if args.new_root is None:
+            regenerate(new_root, args.workers)
+
+        if args.ref_root is None and args.new_root is None:
+            ref_root = REPO_ROOT
+            rels = reference_traces(ref_root)
+        else:
+            ref_root = os.path.abspath(args.ref_root or REPO_ROOT)
+            rels = find_traces(ref_root)
+        if not rels:
+            raise RuntimeError(f"No trace_*.csv found under: {ref_root}")
+
+        cache = load_cache(cache_path, args.rtol, args.atol)
+        jobs = [(rel, os.path.join(ref_root, rel), os.path.join(new_root, rel), args.rtol, args.atol, cache.get(rel))
+                for rel in rels]
+
+        chunk = max(1, len(jobs) // (args.workers * 8))
+        if args.workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=args.workers) as ex:
+                results = list(ex.map(verify_pair, jobs, chunksize=chunk))
+        else:
+            results = [verify_pair(j) for j in jobs]
+
+        if cache_path is not None:
+            save_cache(cache_path, results, args.rtol, args.atol)
+    finally:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    counts = {}
+    failed = 0
+    for r in results:
+        counts[r["how"]] = counts.get(r["how"], 0) + 1
+        if r["ok"]:
+            continue
+        failed += 1
+        d = r["diff"]
+        if r["how"] == "missing_reference":
+            print(f"FAIL {r['rel']}: missing reference trace")
+        elif d is None:
+            print(f"FAIL {r['rel']}: missing regenerated trace")
+        elif d["row"] is None:
+            print(f"FAIL {r['rel']}: header mismatch: ref={d['ref']} new={d['new']}")
+        else:
+            print(f"FAIL {r['rel']}: first divergence at row {d['row']} column {d['column']}: "
+                  f"ref={d['ref']} new={d['new']}")
+
+    detail = ", ".join(f"{k}: {counts[k]}" for k in sorted(counts))
+    print(f"Verified {len(results)} trace pair(s): {len(results) - failed} ok, {failed} failed ({detail})")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()